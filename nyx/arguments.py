@@ -24,6 +24,8 @@ DEFAULT_ARGS = {
   'print_help': False,
 }
 
+Args = collections.namedtuple('Args', DEFAULT_ARGS.keys())
+
 OPT = 'i:s:c:d:l:vh'
 
 OPT_EXPANDED = [
@@ -78,41 +80,12 @@ def parse(argv):
   except getopt.GetoptError as exc:
     raise ValueError('%s (for usage provide --help)' % exc)
 
-  has_port_arg, has_socket_arg = False, False
+  given_opts = set([opt for opt, _ in recognized_args])
+  has_port_arg = '-i' in given_opts or '--interface' in given_opts
+  has_socket_arg = '-s' in given_opts or '--socket' in given_opts
 
   for opt, arg in recognized_args:
-    if opt in ('-i', '--interface'):
-      address = None
-
-      if ':' in arg:
-        address, port = arg.split(':', 1)
-      else:
-        port = arg
-
-      if address:
-        if not stem.util.connection.is_valid_ipv4_address(address):
-          raise ValueError("'%s' isn't a valid IPv4 address" % address)
-      else:
-        address = args['control_port'][0]
-
-      if not stem.util.connection.is_valid_port(port):
-        raise ValueError("'%s' isn't a valid port number" % port)
-
-      args['control_port'] = (address, int(port))
-      has_port_arg = True
-    elif opt in ('-s', '--socket'):
-      args['control_socket'] = arg
-      has_socket_arg = True
-    elif opt in ('-c', '--config'):
-      args['config'] = arg
-    elif opt in ('-d', '--debug'):
-      args['debug_path'] = os.path.expanduser(arg)
-    elif opt in ('-l', '--log'):
-      args['logged_events'] = arg
-    elif opt in ('-v', '--version'):
-      args['print_version'] = True
-    elif opt in ('-h', '--help'):
-      args['print_help'] = True
+    OPT_HANDLERS[opt](args, arg)
 
   # If the user explicitely specified an endpoint then just try to connect to
   # that.
@@ -124,7 +97,6 @@ def parse(argv):
 
   # translates our args dict into a named tuple
 
-  Args = collections.namedtuple('Args', args.keys())
   return Args(**args)
 
 
@@ -151,3 +123,65 @@ def get_version():
   """
 
   return 'nyx version %s (released %s)\n' % (nyx.__version__, nyx.__release_date__)
+
+
+def _set_interface(args, arg):
+  address = None
+
+  if ':' in arg:
+    address, port = arg.split(':', 1)
+  else:
+    port = arg
+
+  if address:
+    if not stem.util.connection.is_valid_ipv4_address(address):
+      raise ValueError("'%s' isn't a valid IPv4 address" % address)
+  else:
+    address = args['control_port'][0]
+
+  if not stem.util.connection.is_valid_port(port):
+    raise ValueError("'%s' isn't a valid port number" % port)
+
+  args['control_port'] = (address, int(port))
+
+
+def _set_socket(args, arg):
+  args['control_socket'] = arg
+
+
+def _set_config(args, arg):
+  args['config'] = arg
+
+
+def _set_debug(args, arg):
+  args['debug_path'] = os.path.expanduser(arg)
+
+
+def _set_log(args, arg):
+  args['logged_events'] = arg
+
+
+def _set_version(args, arg):
+  args['print_version'] = True
+
+
+def _set_help(args, arg):
+  args['print_help'] = True
+
+
+OPT_HANDLERS = {
+  '-i': _set_interface,
+  '--interface': _set_interface,
+  '-s': _set_socket,
+  '--socket': _set_socket,
+  '-c': _set_config,
+  '--config': _set_config,
+  '-d': _set_debug,
+  '--debug': _set_debug,
+  '-l': _set_log,
+  '--log': _set_log,
+  '-v': _set_version,
+  '--version': _set_version,
+  '-h': _set_help,
+  '--help': _set_help,
+}
@@ -13,6 +13,7 @@ if we want Windows support in the future too.
 
   start - initializes curses with the given function
   key_input - get keypress by user
+  pending_key_input - get keypress if one is buffered
   str_input - text field where user can input a string
   curses_attr - curses encoded text attribute
   clear - wipes all content from the screen
@@ -29,6 +30,7 @@ if we want Windows support in the future too.
   is_wide_characters_supported - checks if curses supports wide character
 
   draw - renders subwindow that can be drawn into
+  doupdate - applies deferred draw updates to the screen
 
   Subwindow - subwindow that can be drawn within
     |- addstr - draws a string
@@ -39,6 +41,7 @@ if we want Windows support in the future too.
     +- vline - draws a vertical line
 
   KeyInput - user keyboard input
+    |- keycode - raw keycode of this input
     |- match - checks if this matches the given inputs
     |- is_scroll - true if key is used for scrolling
     +- is_selection - true if key should trigger selection
@@ -100,6 +103,13 @@ import stem.util.log
 import stem.util.str_tools
 import stem.util.system
 
+try:
+  # added in python 3.3, unlike time() this can't jump backward
+
+  from time import monotonic
+except ImportError:
+  from time import time as monotonic
+
 # Curses screen we've initialized and lock for interacting with it. Curses
 # isn't thread safe and concurrency bugs produce especially sinister glitches.
 
@@ -107,6 +117,19 @@ CURSES_SCREEN = None
 CURSES_LOCK = threading.RLock()
 HALT_ACTIVITY = False
 
+# Subwindows by their geometry. Subwindows share the screen's buffer so they
+# can be reused, saving an allocation on each draw. The cache is dropped when
+# the screen is resized.
+
+SUBWINDOW_CACHE = {}
+SUBWINDOW_CACHE_DIMENSIONS = None
+
+# Timeout of the last key_input() call so we only change curses' input mode
+# when it differs. The -1 initialization is simply a sentinel that differs
+# from both None (no timeout) and all valid timeouts.
+
+LAST_INPUT_TIMEOUT = -1
+
 # Text colors and attributes. These are *very* commonly used so including
 # shorter aliases (so they can be referenced as just GREEN or BOLD).
 
@@ -162,6 +185,7 @@ SPECIAL_KEYS = {
   'page_up': curses.KEY_PPAGE,
   'page_down': curses.KEY_NPAGE,
   'esc': 27,
+  'resize': curses.KEY_RESIZE,
 }
 
 Dimensions = collections.namedtuple('Dimensions', ['width', 'height'])
@@ -228,17 +252,40 @@ def key_input(input_timeout = None):
   :returns: :class:`~nyx.curses.KeyInput` that was pressed
   """
 
-  if input_timeout:
-    # Timeout can't be longer than 25.5 seconds...
-    # https://docs.python.org/2/library/curses.html?#curses.halfdelay
+  global LAST_INPUT_TIMEOUT
 
-    curses.halfdelay(min(input_timeout * 10, 255))
-  else:
-    curses.cbreak()  # wait indefinitely for key presses (no timeout)
+  if input_timeout != LAST_INPUT_TIMEOUT:
+    if input_timeout:
+      # Timeout can't be longer than 25.5 seconds...
+      # https://docs.python.org/2/library/curses.html?#curses.halfdelay
+
+      curses.halfdelay(min(input_timeout * 10, 255))
+    else:
+      curses.cbreak()  # wait indefinitely for key presses (no timeout)
+
+    LAST_INPUT_TIMEOUT = input_timeout
 
   return KeyInput(CURSES_SCREEN.getch())
 
 
+def pending_key_input():
+  """
+  Gets a key press if one is already buffered, without waiting for input. This
+  lets callers coalesce a burst of key presses (such as a held down key or
+  paste) into a single redraw.
+
+  :returns: :class:`~nyx.curses.KeyInput` that was pressed, this is null if no
+    input is pending
+  """
+
+  CURSES_SCREEN.nodelay(True)
+
+  try:
+    return KeyInput(CURSES_SCREEN.getch())
+  finally:
+    CURSES_SCREEN.nodelay(False)
+
+
 def str_input(x, y, initial_text = '', backlog = None, tab_completion = None):
   """
   Provides a text field where the user can input a string, blocking until
@@ -707,7 +754,7 @@ def is_wide_characters_supported():
   return False
 
 
-def draw(func, left = 0, top = 0, width = None, height = None, background = None, draw_if_resized = None):
+def draw(func, left = 0, top = 0, width = None, height = None, background = None, draw_if_resized = None, defer_update = False):
   """
   Renders a subwindow. This calls the given draw function with a
   :class:`~nyx.curses._Subwindow`.
@@ -720,23 +767,33 @@ def draw(func, left = 0, top = 0, width = None, height = None, background = None
   :param nyx.curses.Color background: background color, unset if **None**
   :param nyx.curses.Dimension draw_if_resized: only draw content if
     dimentions have changed from this
+  :param bool defer_update: queues the screen update until
+    :func:`~nyx.curses.doupdate` is called, letting callers batch several
+    draws into a single update
 
   :returns: :class:`~nyx.curses.Dimension` for the space we drew within
   """
 
-  start = time.time()
+  start = monotonic()
 
   while not CURSES_LOCK.acquire(False):
-    if (time.time() - start) > 1:
+    if (monotonic() - start) > 1:
       return  # if we've been blocked from drawing for a full second then abort
 
     time.sleep(0.05)
 
   try:
+    global SUBWINDOW_CACHE_DIMENSIONS
+
     if HALT_ACTIVITY:
       return
 
     dimensions = screen_size()
+
+    if dimensions != SUBWINDOW_CACHE_DIMENSIONS:
+      SUBWINDOW_CACHE.clear()
+      SUBWINDOW_CACHE_DIMENSIONS = dimensions
+
     subwindow_width = max(0, dimensions.width - left)
     subwindow_height = max(0, dimensions.height - top)
 
@@ -751,14 +808,24 @@ def draw(func, left = 0, top = 0, width = None, height = None, background = None
     if subwindow_dimensions == draw_if_resized:
       return subwindow_dimensions  # draw size hasn't changed
 
-    curses_subwindow = CURSES_SCREEN.subwin(subwindow_height, subwindow_width, top, left)
+    window_key = (subwindow_height, subwindow_width, top, left)
+    curses_subwindow = SUBWINDOW_CACHE.get(window_key)
+
+    if curses_subwindow is None:
+      curses_subwindow = CURSES_SCREEN.subwin(subwindow_height, subwindow_width, top, left)
+      SUBWINDOW_CACHE[window_key] = curses_subwindow
+
     curses_subwindow.erase()
 
     if background:
       curses_subwindow.bkgd(' ', curses_attr(background, HIGHLIGHT))
 
     func(_Subwindow(subwindow_width, subwindow_height, curses_subwindow))
-    curses_subwindow.refresh()
+
+    if defer_update:
+      curses_subwindow.noutrefresh()
+    else:
+      curses_subwindow.refresh()
 
     return subwindow_dimensions
   except curses.error:
@@ -767,6 +834,16 @@ def draw(func, left = 0, top = 0, width = None, height = None, background = None
     CURSES_LOCK.release()
 
 
+def doupdate():
+  """
+  Applies screen updates that were deferred by :func:`~nyx.curses.draw`.
+  """
+
+  with CURSES_LOCK:
+    if not HALT_ACTIVITY:
+      curses.doupdate()
+
+
 class _Subwindow(object):
   """
   Subwindow that can be drawn within.
@@ -958,11 +1035,20 @@ class KeyInput(object):
   def __init__(self, key):
     self._key = key  # pressed key as an integer
 
+  def keycode(self):
+    """
+    Provides the raw curses keycode of this input.
+
+    :returns: **int** keycode this was constructed with
+    """
+
+    return self._key
+
   def match(self, *keys):
     """
     Checks if we have a case insensitive match with the given key. Beside
     characters, this also recognizes: up, down, left, right, home, end,
-    page_up, page_down, and esc.
+    page_up, page_down, esc, and resize.
     """
 
     if self.is_null():
@@ -6,6 +6,7 @@ Menu for controlling nyx.
 """
 
 import functools
+import weakref
 
 import nyx.curses
 import nyx.popups
@@ -14,7 +15,17 @@ import stem
 
 from nyx import nyx_interface, tor_controller, show_message
 from nyx.curses import RED, WHITE, NORMAL, BOLD, UNDERLINE
-from stem.util import str_tools
+from stem.util import enum, str_tools
+
+# Degree to which a keypress changed our selection, ordered from no change at
+# all through closing the menu entirely.
+
+MenuSelectionChange = enum.Enum('SAME', 'ROW_MOVED', 'SUBMENU_CHANGED', 'DONE')
+
+# Rendered (menu_width, labels) of submenus. Submenu content is static for the
+# lifetime of the menu so this saves us reformatting labels on each repaint.
+
+SUBMENU_RENDER_CACHE = weakref.WeakKeyDictionary()
 
 
 class MenuItem(object):
@@ -35,6 +46,7 @@ class MenuItem(object):
     self.label = label
     self.suffix = ''
     self._parent = None
+    self._submenu = None  # memoized top-level submenu
 
     if args:
       self._callback = functools.partial(callback, *args)
@@ -59,7 +71,10 @@ class MenuItem(object):
 
   @property
   def submenu(self):
-    return self._parent.submenu if (self._parent and self._parent._parent) else self
+    if self._submenu is None:
+      self._submenu = self._parent.submenu if (self._parent and self._parent._parent) else self
+
+    return self._submenu
 
   def select(self):
     """
@@ -69,6 +84,13 @@ class MenuItem(object):
     if self._callback:
       self._callback()
 
+  def _flush_cache(self):
+    """
+    Drops our memoized hierarchy attributes, needed if our ancestry changes.
+    """
+
+    self._submenu = None
+
   def _sibling(self, offset):
     """
     Provides sibling with a given offset from us.
@@ -121,8 +143,15 @@ class Submenu(MenuItem):
         raise ValueError("Menu option '%s' already has a parent" % menu_item)
 
       menu_item._parent = self
+      menu_item._flush_cache()
       self.children.append(menu_item)
 
+  def _flush_cache(self):
+    MenuItem._flush_cache(self)
+
+    for child in self.children:
+      child._flush_cache()
+
 
 class RadioMenuItem(MenuItem):
   """
@@ -163,56 +192,167 @@ class MenuCursor(object):
     self.is_done = False
 
   def handle_key(self, key):
+    """
+    Adjusts our selection based on the given user input.
+
+    :param nyx.curses.KeyInput key: key pressed by the user
+
+    :returns: :data:`~nyx.menu.MenuSelectionChange` describing how this
+      changed our selection
+    """
+
+    previous_selection = self.selection
+
     if key.is_selection():
-      if isinstance(self.selection, Submenu):
-        if self.selection.children:
-          self.selection = self.selection.children[0]
-      else:
-        self.selection.select()
-        self.is_done = True
-    elif key.match('up'):
-      self.selection = self.selection.prev
-    elif key.match('down'):
-      self.selection = self.selection.next
-    elif key.match('left'):
-      if self.selection.parent == self.selection.submenu:
-        # shift to the previous main submenu
-
-        prev_submenu = self.selection.submenu.prev
-        self.selection = prev_submenu.children[0]
-      else:
-        # go up a submenu level
-
-        self.selection = self.selection.parent
-    elif key.match('right'):
-      if isinstance(self.selection, Submenu):
-        # open submenu (same as making a selection)
-
-        if self.selection.children:
-          self.selection = self.selection.children[0]
-      else:
-        # shift to the next main submenu
-
-        next_submenu = self.selection.submenu.next
-        self.selection = next_submenu.children[0]
-    elif key.match('esc', 'm'):
+      self._handle_select()
+    else:
+      handler = KEY_HANDLERS.get(key.keycode())
+
+      if handler:
+        handler(self)
+
+    if self.is_done:
+      return MenuSelectionChange.DONE
+    elif self.selection is previous_selection:
+      return MenuSelectionChange.SAME
+    elif self.selection.parent is previous_selection.parent:
+      return MenuSelectionChange.ROW_MOVED
+    else:
+      return MenuSelectionChange.SUBMENU_CHANGED
+
+  def _handle_select(self):
+    if isinstance(self.selection, Submenu):
+      if self.selection.children:
+        self.selection = self.selection.children[0]
+    else:
+      self.selection.select()
       self.is_done = True
 
+  def _handle_up(self):
+    self.selection = self.selection.prev
+
+  def _handle_down(self):
+    self.selection = self.selection.next
+
+  def _handle_left(self):
+    if self.selection.parent is self.selection.submenu:
+      # shift to the previous main submenu
+
+      self._cycle_submenu(-1)
+    else:
+      # go up a submenu level
+
+      self.selection = self.selection.parent
+
+  def _handle_right(self):
+    if isinstance(self.selection, Submenu):
+      # open submenu (same as making a selection)
+
+      if self.selection.children:
+        self.selection = self.selection.children[0]
+    else:
+      # shift to the next main submenu
+
+      self._cycle_submenu(1)
+
+  def _cycle_submenu(self, offset):
+    """
+    Shifts our selection to the first item of an adjacent main submenu.
+
+    :param int offset: number of submenus to shift by, negative values
+      moving left
+    """
+
+    self.selection = self.selection.submenu._sibling(offset).children[0]
+
+  def _handle_close(self):
+    self.is_done = True
+
+
+# Cursor actions by keycode, so handling a key press is a single lookup rather
+# than a series of match() calls.
+
+KEY_HANDLERS = {
+  nyx.curses.SPECIAL_KEYS['up']: MenuCursor._handle_up,
+  nyx.curses.SPECIAL_KEYS['down']: MenuCursor._handle_down,
+  nyx.curses.SPECIAL_KEYS['left']: MenuCursor._handle_left,
+  nyx.curses.SPECIAL_KEYS['right']: MenuCursor._handle_right,
+  nyx.curses.SPECIAL_KEYS['esc']: MenuCursor._handle_close,
+  ord('m'): MenuCursor._handle_close,
+  ord('M'): MenuCursor._handle_close,
+}
+
 
 def show_menu():
   menu = _make_menu()
   cursor = MenuCursor(menu.children[0].children[0])
 
+  # Menubar labels and the coordinates they're drawn at, fixed for the menu's
+  # lifetime.
+
+  menubar_entries, submenu_left, x = [], {}, 0
+
+  for submenu in menu.children:
+    submenu_left[submenu] = x
+    menubar_entries.append((x, ' %s ' % submenu.label, submenu))
+    x += len(submenu.label) + 3
+
   with nyx.curses.CURSES_LOCK:
     show_message('Press m or esc to close the menu.', BOLD)
 
+    selection_x = submenu_left[cursor.selection.submenu]
+    _draw_top_menubar(menubar_entries, cursor.selection)
+    _draw_submenu(cursor.selection, cursor.selection.submenu, 1, selection_x)
+    nyx.curses.doupdate()
+
     while not cursor.is_done:
-      selection_x = _draw_top_menubar(menu, cursor.selection)
-      _draw_submenu(cursor.selection, cursor.selection.submenu, 1, selection_x)
-      cursor.handle_key(nyx.curses.key_input())
-      nyx_interface().redraw(True)
+      change = _selection_change(cursor, nyx.curses.key_input())
+
+      # Coalesce any buffered key presses (held down keys, pastes, etc) into
+      # this repaint, tracking the most drastic selection change among them.
+
+      while not cursor.is_done:
+        next_key = nyx.curses.pending_key_input()
+
+        if next_key.is_null():
+          break
 
-    show_message()
+        next_change = _selection_change(cursor, next_key)
+
+        if MenuSelectionChange.index_of(next_change) > MenuSelectionChange.index_of(change):
+          change = next_change
+
+      if change == MenuSelectionChange.ROW_MOVED:
+        # only the highlighted row changed so repaint the open submenus in place
+
+        _draw_submenu(cursor.selection, cursor.selection.submenu, 1, selection_x)
+        nyx.curses.doupdate()
+      elif change == MenuSelectionChange.SUBMENU_CHANGED:
+        # erase submenus we're no longer showing before drawing the new ones
+
+        nyx_interface().redraw(True)
+        selection_x = submenu_left[cursor.selection.submenu]
+        _draw_top_menubar(menubar_entries, cursor.selection)
+        _draw_submenu(cursor.selection, cursor.selection.submenu, 1, selection_x)
+        nyx.curses.doupdate()
+
+    # Our caller's next iteration redraws the full interface, so clearing the
+    # message doesn't need a repaint of its own.
+
+    show_message(redraw = False)
+
+
+def _selection_change(cursor, key):
+  """
+  Passes the key press to the cursor, providing the selection change it
+  caused. Terminal resizes are reported as SUBMENU_CHANGED since that branch
+  repaints the panels behind the menu as well as the menu itself.
+  """
+
+  if key.match('resize'):
+    return MenuSelectionChange.SUBMENU_CHANGED
+
+  return cursor.handle_key(key)
 
 
 def _make_menu():
@@ -284,19 +424,13 @@ def _view_menu():
   return view_menu
 
 
-def _draw_top_menubar(menu, selection):
+def _draw_top_menubar(menubar_entries, selection):
   def _render(subwindow):
-    x = 0
-
-    for submenu in menu.children:
-      x = subwindow.addstr(x, 0, ' %s ' % submenu.label, BOLD, UNDERLINE if submenu == selection.submenu else NORMAL)
+    for x, label, submenu in menubar_entries:
+      x = subwindow.addstr(x, 0, label, BOLD, UNDERLINE if submenu is selection.submenu else NORMAL)
       subwindow.vline(x, 0, 1)
-      x += 1
-
-  nyx.curses.draw(_render, height = 1, background = RED)
 
-  selection_index = menu.children.index(selection.submenu)
-  return 3 * selection_index + sum([len(entry.label) for entry in menu.children[:selection_index]])
+  nyx.curses.draw(_render, height = 1, background = RED, defer_update = True)
 
 
 def _draw_submenu(selection, submenu, top, left):
@@ -304,23 +438,28 @@ def _draw_submenu(selection, submenu, top, left):
 
   submenu_selection = selection
 
-  while submenu_selection.parent != submenu:
+  while submenu_selection.parent is not submenu:
     submenu_selection = submenu_selection.parent
 
-  prefix_size = max([len(entry.prefix) for entry in submenu.children])
-  middle_size = max([len(entry.label) for entry in submenu.children])
-  suffix_size = max([len(entry.suffix) for entry in submenu.children])
+  if submenu in SUBMENU_RENDER_CACHE:
+    menu_width, labels = SUBMENU_RENDER_CACHE[submenu]
+  else:
+    prefix_size = max([len(entry.prefix) for entry in submenu.children])
+    middle_size = max([len(entry.label) for entry in submenu.children])
+    suffix_size = max([len(entry.suffix) for entry in submenu.children])
+
+    menu_width = prefix_size + middle_size + suffix_size + 2
+    label_format = ' %%-%is%%-%is%%-%is ' % (prefix_size, middle_size, suffix_size)
+    labels = [label_format % (entry.prefix, entry.label, entry.suffix) for entry in submenu.children]
 
-  menu_width = prefix_size + middle_size + suffix_size + 2
-  label_format = ' %%-%is%%-%is%%-%is ' % (prefix_size, middle_size, suffix_size)
+    SUBMENU_RENDER_CACHE[submenu] = (menu_width, labels)
 
   def _render(subwindow):
     for y, menu_item in enumerate(submenu.children):
-      label = label_format % (menu_item.prefix, menu_item.label, menu_item.suffix)
-      attr = (WHITE, BOLD) if menu_item == submenu_selection else (NORMAL,)
-      subwindow.addstr(0, y, label, *attr)
+      attr = (WHITE, BOLD) if menu_item is submenu_selection else (NORMAL,)
+      subwindow.addstr(0, y, labels[y], *attr)
 
-  nyx.curses.draw(_render, top = top, left = left, width = menu_width, height = len(submenu.children), background = RED)
+  nyx.curses.draw(_render, top = top, left = left, width = menu_width, height = len(submenu.children), background = RED, defer_update = True)
 
-  if submenu != selection.parent:
+  if submenu is not selection.parent:
     _draw_submenu(selection, submenu_selection, top + submenu.children.index(submenu_selection), left + menu_width)
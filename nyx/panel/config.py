@@ -8,6 +8,7 @@ and the resulting configuration files saved.
 
 import collections
 import curses
+import threading
 
 import nyx.curses
 import nyx.panel
@@ -29,6 +30,13 @@ try:
 except ImportError:
   from stem.util.lru_cache import lru_cache
 
+try:
+  # added in python 3.3, unlike time() this can't jump backward
+
+  from time import monotonic
+except ImportError:
+  from time import time as monotonic
+
 SortAttr = enum.Enum('NAME', 'VALUE', 'VALUE_TYPE', 'CATEGORY', 'USAGE', 'SUMMARY', 'DESCRIPTION', 'MAN_PAGE_ENTRY', 'IS_SET')
 ManualEntry = collections.namedtuple('ManualEntry', ['category', 'usage', 'summary', 'description', 'position'])
 
@@ -166,6 +174,20 @@ class ConfigPanel(nyx.panel.Panel):
     self._sort_order = CONFIG['config_order']
     self._show_all = False  # show all options, or just the important ones
 
+    # Fetching the options tor supports and their man page information is
+    # slow, so doing so in a background thread rather than blocking startup.
+
+    load_thread = threading.Thread(target = self._load_config_options)
+    load_thread.setDaemon(True)
+    load_thread.start()
+
+  def _load_config_options(self):
+    """
+    Fetches the configuration options tor supports.
+    """
+
+    start_time = monotonic()
+
     try:
       for line in tor_controller().get_info('config/names').splitlines():
         # Lines of the form "<option> <type>[ <documentation>]". Documentation
@@ -191,6 +213,8 @@ class ConfigPanel(nyx.panel.Panel):
           self._important_content.append(entry)
 
       self._sort_content()
+      log.info('Loaded the configuration options tor supports, took %0.2fs.' % (monotonic() - start_time))
+      self.redraw()
     except stem.ControllerError as exc:
       log.warn('Unable to determine the configuration options tor supports: %s' % exc)
 
@@ -234,6 +258,9 @@ class ConfigPanel(nyx.panel.Panel):
         self.redraw()
 
     def _edit_selected_value():
+      if not self._get_config_options():
+        return  # nothing selectable, options either failed or haven't loaded
+
       selected = self._scroller.selection(self._get_config_options())
       initial_value = selected.value() if selected.is_set() else ''
       new_value = input_prompt('%s Value (esc to cancel): ' % selected.name, initial_value)
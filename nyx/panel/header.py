@@ -63,6 +63,8 @@ class HeaderPanel(nyx.panel.DaemonPanel):
     :param str message: message to be displayed
     :param list attr: text attributes to apply
     :param int max_wait: seconds to wait for user input, no limit if **None**
+    :param bool redraw: presents the change immediately if **True**, used to
+      avoid a needless repaint when the caller is about to redraw anyway
 
     :returns: :class:`~nyx.curses.KeyInput` user pressed if provided a
       **max_wait**, **None** otherwise or if prompt was canceled
@@ -70,7 +72,9 @@ class HeaderPanel(nyx.panel.DaemonPanel):
 
     self._message = message
     self._message_attr = attr
-    self.redraw()
+
+    if kwargs.get('redraw', True):
+      self.redraw()
 
     if 'max_wait' in kwargs:
       user_input = nyx.curses.key_input(kwargs['max_wait'])
@@ -159,7 +159,7 @@ def _setup_debug_logging(args):
   if os.path.exists(args.config):
     try:
       with open(args.config) as nyxrc_file:
-        nyxrc_content = nyxrc_file.read()
+        nyxrc_content = _scrub_password(nyxrc_file.read())
     except IOError as exc:
       nyxrc_content = '[unable to read file: %s]' % exc.strerror
 
@@ -174,6 +174,25 @@ def _setup_debug_logging(args):
   ))
 
 
+def _scrub_password(nyxrc_content):
+  """
+  Provides the given nyxrc content with any controller password replaced, so
+  it doesn't appear in our debug log.
+
+  :param str nyxrc_content: nyxrc content to be scrubbed
+
+  :returns: **str** content with the password omitted
+  """
+
+  lines = nyxrc_content.split('\n')
+
+  for i, line in enumerate(lines):
+    if line.strip().split(' ', 1)[0] == 'password':
+      lines[i] = 'password <scrubbed>'
+
+  return '\n'.join(lines)
+
+
 def _warn_if_root(controller):
   """
   Give a notice if tor or nyx are running with root.
@@ -7,7 +7,7 @@ import unittest
 
 import nyx.curses
 
-from nyx.menu import MenuItem, Submenu, RadioMenuItem, RadioGroup, MenuCursor
+from nyx.menu import MenuItem, MenuSelectionChange, Submenu, RadioMenuItem, RadioGroup, MenuCursor
 
 
 class Container(object):
@@ -246,3 +246,35 @@ class TestMenuCursor(unittest.TestCase):
 
     cursor = menu_cursor(ord('m'))
     self.assertTrue(cursor.is_done)
+
+  def test_handle_key_reports_selection_change(self):
+    cursor = menu_cursor()
+
+    def change_for(key):
+      return cursor.handle_key(nyx.curses.KeyInput(key))
+
+    self.assertEqual(MenuSelectionChange.SAME, change_for(ord('z')))  # unrecognized key
+    self.assertEqual(MenuSelectionChange.ROW_MOVED, change_for(curses.KEY_DOWN))  # Item 1 => Item 2
+    self.assertEqual(MenuSelectionChange.ROW_MOVED, change_for(curses.KEY_DOWN))  # Item 2 => Inner Submenu
+    self.assertEqual(MenuSelectionChange.SUBMENU_CHANGED, change_for(curses.KEY_RIGHT))  # descend to Item 3
+    self.assertEqual(MenuSelectionChange.SUBMENU_CHANGED, change_for(curses.KEY_LEFT))  # back up to Inner Submenu
+    self.assertEqual(MenuSelectionChange.SUBMENU_CHANGED, change_for(curses.KEY_LEFT))  # cycle to Item 4
+    self.assertEqual(MenuSelectionChange.SUBMENU_CHANGED, change_for(curses.KEY_RIGHT))  # cycle to Item 1
+    self.assertEqual(MenuSelectionChange.DONE, change_for(27))
+
+    # selecting an item closes the menu too
+
+    self.assertEqual(MenuSelectionChange.DONE, menu_cursor().handle_key(nyx.curses.KeyInput(curses.KEY_ENTER)))
+
+  def test_selection_change_ordering(self):
+    # show_menu coalesces buffered key presses by keeping the most drastic
+    # selection change among them, which relies on the enum's ordering
+
+    expected = [
+      MenuSelectionChange.SAME,
+      MenuSelectionChange.ROW_MOVED,
+      MenuSelectionChange.SUBMENU_CHANGED,
+      MenuSelectionChange.DONE,
+    ]
+
+    self.assertEqual(expected, list(MenuSelectionChange))
@@ -0,0 +1,46 @@
+"""
+Unit tests for nyx.starter.
+"""
+
+import unittest
+
+from nyx.starter import _scrub_password
+
+
+class TestScrubPassword(unittest.TestCase):
+  def test_scrubs_password_entries(self):
+    nyxrc = '\n'.join((
+      'color_override green',
+      'password s3kr3t',
+      '  password  indented_and_spaced',
+    ))
+
+    expected = '\n'.join((
+      'color_override green',
+      'password <scrubbed>',
+      'password <scrubbed>',
+    ))
+
+    self.assertEqual(expected, _scrub_password(nyxrc))
+
+  def test_keeps_other_keys(self):
+    # 'password' must match the whole key, not just be a prefix of it
+
+    nyxrc = '\n'.join((
+      'passwordx s3kr3t',
+      'password_prompt true',
+    ))
+
+    self.assertEqual(nyxrc, _scrub_password(nyxrc))
+
+  def test_keeps_comments_and_blank_lines(self):
+    nyxrc = '\n'.join((
+      '# password s3kr3t',
+      '',
+      'color_override green',
+    ))
+
+    self.assertEqual(nyxrc, _scrub_password(nyxrc))
+
+  def test_empty_content(self):
+    self.assertEqual('', _scrub_password(''))